@@ -8,17 +8,24 @@
 # and the "why" so you can learn as you go.
 # ------------------------------------------------------------
 
-import json
+import bisect
 import os
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta, timezone
-from dateutil import tz
 from typing import Dict, List, Tuple, Optional
+from uuid import uuid4
+from zoneinfo import ZoneInfo
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
-import yfinance as yf
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
-from streamlit_autorefresh import st_autorefresh
+from diskcache import Cache
 
 # =========================
 # Paths & lightweight storage
@@ -35,25 +42,67 @@ os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(CONFIG_DIR, exist_ok=True)
 
 
+@st.cache_resource(show_spinner=False)
+def _geo_cache() -> Cache:
+    """
+    Geocoder results persisted across restarts (city -> (lat, lon)); see geocode_city().
+    Opened once per process so reruns don't each open a new SQLite handle.
+    """
+    return Cache(os.path.join(DATA_DIR, "geocache"))
+
+
+GEO_CACHE = _geo_cache()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)  # A few versions of our 3 files
+def _load_json_cached(path: str, mtime_ns: int, size: int):
+    """
+    Parse a JSON file once per (mtime, size); save_json() changes the mtime, so edits
+    show up. Size is part of the key because coarse filesystem timestamps can give
+    two quick writes the same mtime.
+    """
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
 def load_json(path: str, default):
     """Friendly safeguard: if a JSON file is missing/corrupt, fall back to a default."""
     try:
         if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            info = os.stat(path)
+            return _load_json_cached(path, info.st_mtime_ns, info.st_size)
     except Exception as e:
         st.warning(f"Could not load {os.path.basename(path)}. Using defaults. ({e})")
     return default
 
 
 def save_json(path: str, data):
-    """Tiny helper to write JSON with nice indentation and UTF-8 encoding."""
+    """
+    Write JSON (UTF-8, 2-space indent) crash-safely.
+    Why the temp file? We write the new bytes to a uniquely named file next to the
+    target (sessions are threads, so they must not share one), fsync it, then swap it
+    in with os.replace(), which is atomic — a crash mid-write can't leave a half file.
+    """
+    tmp = None
     try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        folder = os.path.dirname(path)
+        os.makedirs(folder, exist_ok=True)
+        data_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        fd, tmp = tempfile.mkstemp(dir=folder, prefix=os.path.basename(path) + ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data_bytes)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            # mkstemp creates 0600 files; keep the existing file's permissions instead
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(tmp, path)
+        tmp = None
     except Exception as e:
         st.error(f"Error saving to {os.path.basename(path)}: {e}")
+    finally:
+        if tmp and os.path.exists(tmp):
+            os.remove(tmp)  # Don't leave stray temp files behind after a failed save
 
 
 # Initial persisted settings (safe defaults if first run)
@@ -67,10 +116,63 @@ settings = load_json(
         "dark_mode": False,
     },
 )
-reminders: List[Dict] = load_json(REMINDERS_PATH, [])
+
+
+def _load_reminders() -> Tuple[Dict[str, Dict], List[Tuple[str, str]]]:
+    """
+    Reminders are kept in memory keyed by id (deletes are a dict pop) plus a sort
+    index of (due, id) pairs for ordered views and bisect range lookups.
+    The file is always saved in index order, so loading just reads that order
+    back — no sort. Older files (missing ids, or not in order) are fixed up and
+    saved once, so ids (and widget keys) stay stable.
+    """
+    records = load_json(REMINDERS_PATH, [])
+    dirty = False
+    for r in records:
+        if "id" not in r:
+            r["id"] = uuid4().hex
+            dirty = True
+    order = [(r.get("due", ""), r["id"]) for r in records]
+    if any(a > b for a, b in zip(order, order[1:])):  # O(n) check; sort only legacy files
+        order.sort()
+        dirty = True
+    by_id = {r["id"]: r for r in records}
+    if dirty:
+        save_json(REMINDERS_PATH, [by_id[id_] for _, id_ in order])
+    return by_id, order
+
+
+reminders: Dict[str, Dict]
+reminder_order: List[Tuple[str, str]]  # (due, id) pairs, kept ordered with bisect.insort
+reminders, reminder_order = _load_reminders()
 favorites: List[Dict] = load_json(FAVORITES_PATH, [])
 
 
+# =========================
+# HTTP session (shared connection pool)
+# =========================
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    """
+    One Session per process (not per rerun) reuses TCP/TLS connections to the same
+    host, so repeat calls to Open-Meteo / Nominatim skip the handshake.
+    Retries cover brief 5xx hiccups.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": "PythonDashboard/1.0 (local)"})  # Be nice to their servers
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _http_session()
+
+
 # =========================
 # Theme (dark / light)
 # =========================
@@ -118,54 +220,105 @@ def sanitize_city_input(s: str) -> str:
     return s
 
 
+def _geocode_open_meteo(cleaned: str) -> Optional[Tuple[float, float]]:
+    """
+    Open-Meteo geocoder (fast, no key). Returns (lat, lon), or None if it has no match.
+    Network/HTTP errors are raised (not swallowed) so a transient outage isn't
+    mistaken for "city not found".
+    """
+    url = "https://geocoding-api.open-meteo.com/v1/search"
+    r = SESSION.get(url, params={"name": cleaned, "count": 1, "language": "en"}, timeout=10)
+    r.raise_for_status()
+    data = r.json()
+    results = data.get("results", [])
+    if results:
+        return (float(results[0]["latitude"]), float(results[0]["longitude"]))
+    return None
+
+
+def _geocode_nominatim(cleaned: str) -> Optional[Tuple[float, float]]:
+    """
+    OpenStreetMap Nominatim (polite UA, small limit). Returns (lat, lon), or None
+    if it has no match. Network/HTTP errors are raised, like _geocode_open_meteo().
+    """
+    url = "https://nominatim.openstreetmap.org/search"
+    r = SESSION.get(  # Polite User-Agent comes from the shared session
+        url,
+        params={"q": cleaned, "format": "json", "limit": 1, "addressdetails": 1},
+        timeout=12,
+    )
+    r.raise_for_status()
+    data = r.json()
+    if isinstance(data, list) and data:
+        lat = float(data[0]["lat"])
+        lon = float(data[0]["lon"])
+        return (lat, lon)
+    return None
+
+
+@st.cache_resource(show_spinner=False)
+def _geocode_pool() -> ThreadPoolExecutor:
+    """Process-wide worker pool for geocoder lookups (built once, not per rerun)."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="geocode")
+
+
+@st.cache_data(ttl=86400, show_spinner=False)  # Coordinates rarely change; cache for a day
 def geocode_city(name: str) -> Optional[Tuple[float, float]]:
     """
-    Try Open-Meteo geocoding first (fast, no key).
-    If that returns nothing, fall back to OpenStreetMap Nominatim.
-    Returns (lat, lon) or None if both fail.
+    Ask Open-Meteo and Nominatim at the same time, but prefer Open-Meteo's answer.
+    Why both at once? On a cold cache the old "try one, then the other" chain cost
+    two round-trips whenever Open-Meteo missed; now Nominatim is already in flight.
+    Preferring Open-Meteo keeps the stored coordinates the same from run to run.
+    Returns (lat, lon), or None only when both services answered "no match".
+    Raises RuntimeError if a service couldn't be reached and nothing matched;
+    st.cache_data doesn't cache exceptions, so the next rerun simply retries.
+    Cached per city name in memory (st.cache_data) and on disk (GEO_CACHE), so
+    neither autorefresh reruns nor restarts re-hit the geocoders.
     """
     cleaned = sanitize_city_input(name)
 
-    # 1) Open-Meteo geocoder
-    try:
-        url = "https://geocoding-api.open-meteo.com/v1/search"
-        r = requests.get(url, params={"name": cleaned, "count": 1, "language": "en"}, timeout=10)
-        r.raise_for_status()
-        data = r.json()
-        results = data.get("results", [])
-        if results:
-            return (float(results[0]["latitude"]), float(results[0]["longitude"]))
-    except Exception:
-        pass  # Soft-fail: try fallback
+    # Disk cache survives server restarts (and spares Nominatim repeat lookups)
+    cached = GEO_CACHE.get(cleaned)
+    if cached:
+        return tuple(cached)
 
-    # 2) OpenStreetMap Nominatim (polite UA, small limit)
-    try:
-        url = "https://nominatim.openstreetmap.org/search"
-        headers = {"User-Agent": "PythonDashboard/1.0 (local)"}  # Be nice to their servers
-        r = requests.get(
-            url,
-            params={"q": cleaned, "format": "json", "limit": 1, "addressdetails": 1},
-            headers=headers,
-            timeout=12,
-        )
-        r.raise_for_status()
-        data = r.json()
-        if isinstance(data, list) and data:
-            lat = float(data[0]["lat"])
-            lon = float(data[0]["lon"])
-            return (lat, lon)
-    except Exception:
-        pass
+    pool = _geocode_pool()
+    om = pool.submit(_geocode_open_meteo, cleaned)
+    nom = pool.submit(_geocode_nominatim, cleaned)
+    errors = []
+    for f in (om, nom):  # Open-Meteo first, so its answer wins when both have one
+        try:
+            coords = f.result()
+        except Exception as e:
+            errors.append(e)
+            continue
+        if coords:
+            GEO_CACHE.set(cleaned, coords, expire=30 * 86400)  # Only cache hits, never misses
+            return coords
 
+    if errors:
+        raise RuntimeError(f"Geocoding service unavailable: {errors[0]}") from errors[0]
     return None
 
 
 def fetch_weather(lat: float, lon: float, temp_unit: str = "F") -> Dict:
     """
     Grab current weather + 10-day forecast.
+    Coordinates are rounded to 2 decimals (~1 km) BEFORE the cached call, so
+    nearly-identical manual entries share one cache entry; the forecast grid is
+    coarser than that anyway.
+    """
+    return _fetch_weather_cached(round(float(lat), 2), round(float(lon), 2), temp_unit.upper())
+
+
+@st.cache_data(ttl=600)  # Forecasts update slowly; 10 minutes keeps autorefresh cheap
+def _fetch_weather_cached(lat: float, lon: float, temp_unit: str) -> Dict:
+    """
+    Open-Meteo request behind fetch_weather() (keyed on the rounded coords and the
+    already upper-cased unit).
     Mentor tip: Prefer robust defaults (units, windspeed) and request only what you render.
     """
-    unit_param = "fahrenheit" if temp_unit.upper() == "F" else "celsius"
+    unit_param = "fahrenheit" if temp_unit == "F" else "celsius"
     url = "https://api.open-meteo.com/v1/forecast"
     params = {
         "latitude": lat,
@@ -175,9 +328,9 @@ def fetch_weather(lat: float, lon: float, temp_unit: str = "F") -> Dict:
         "timezone": "auto",
         "forecast_days": 10,
         "temperature_unit": unit_param,
-        "windspeed_unit": "mph" if temp_unit.upper() == "F" else "kmh",
+        "windspeed_unit": "mph" if temp_unit == "F" else "kmh",
     }
-    r = requests.get(url, params=params, timeout=12)
+    r = SESSION.get(url, params=params, timeout=12)
     r.raise_for_status()
     return r.json()
 
@@ -200,10 +353,30 @@ WEATHER_ICON_MAP = {
     95: "⛈️", 96: "⛈️", 99: "⛈️",
 }
 
+# Same data as flat arrays indexed by WMO code (0..99): plain indexing, no hashing,
+# and np.take can look up a whole forecast column at once. "" means "unknown code".
+WEATHER_DESC_ARR = [""] * 100
+WEATHER_ICON_ARR = [""] * 100
+for _code, _desc in WEATHER_CODE_MAP.items():
+    WEATHER_DESC_ARR[_code] = _desc
+for _code, _icon in WEATHER_ICON_MAP.items():
+    WEATHER_ICON_ARR[_code] = _icon
+
 
 # =========================
 # Stocks (robust fetcher + clear notes)
 # =========================
+@st.cache_resource(show_spinner=False)
+def _yf():
+    """
+    Import yfinance on first use (once per process) instead of at startup.
+    Why? It's a heavy import, and the page header/weather can render before it.
+    """
+    import yfinance
+    return yfinance
+
+
+@st.cache_data(ttl=60)  # Matches the autorefresh window
 def fetch_live_price_and_intraday(ticker: str):
     """
     Robust fetch for last price + intraday series (Series named by ticker).
@@ -218,6 +391,8 @@ def fetch_live_price_and_intraday(ticker: str):
     if not ticker:
         return None, None, "No ticker provided."
 
+    yf = _yf()
+
     attempts = [
         ("1m", "1d"),
         ("5m", "5d"),
@@ -305,36 +480,216 @@ def fetch_live_price_and_intraday(ticker: str):
     return None, None, "; ".join(errs) or "No data."
 
 
+@st.cache_data(ttl=60)
+def fetch_intraday_batch(tickers: Tuple[str, ...]) -> Dict[str, pd.Series]:
+    """
+    Fetch 1-minute intraday closes for several tickers with ONE yf.download call.
+    Why? yfinance downloads a ticker list on parallel threads, so three symbols
+    cost about one round-trip instead of three.
+    Returns {ticker: close_series}. Tickers that come back empty are
+    left out so the caller can fall back to fetch_live_price_and_intraday().
+    """
+    symbols = list(dict.fromkeys(t for t in tickers if t))
+    if not symbols:
+        return {}
+
+    yf = _yf()
+
+    try:
+        df = yf.download(
+            tickers=" ".join(symbols),
+            period="1d",
+            interval="1m",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            auto_adjust=False,
+            prepost=True,
+        )
+    except Exception:
+        return {}  # Soft-fail: per-ticker fallback will report the details
+    if df is None or df.empty:
+        return {}
+
+    out = {}
+    for tk in symbols:
+        try:
+            if isinstance(df.columns, pd.MultiIndex):
+                close = df[tk]["Close"].dropna()
+            elif len(symbols) == 1:
+                close = df["Close"].dropna()  # Some yfinance versions flatten a single ticker
+            else:
+                continue
+        except KeyError:
+            continue
+        if close.empty:
+            continue
+        out[tk] = close.rename(tk)
+    return out
+
+
+@st.cache_resource(show_spinner=False)
+def _quote_pool() -> ThreadPoolExecutor:
+    """Process-wide worker pool for per-ticker price lookups (built once, not per rerun)."""
+    return ThreadPoolExecutor(max_workers=3, thread_name_prefix="quote")
+
+
+def _fast_last_price(yf, ticker: str) -> Optional[float]:
+    """
+    Last price via Ticker().fast_info (a small daily-history request under the hood).
+    Note: regular-session price; it doesn't include pre/post-market trades.
+    Runs on pool threads, so it takes the yfinance module instead of calling _yf().
+    """
+    try:
+        lp = yf.Ticker(ticker).fast_info["last_price"]
+        if lp is not None and not pd.isna(lp):
+            return float(lp)
+    except Exception:
+        pass
+    return None
+
+
+@st.cache_data(ttl=60)
+def get_last_prices(tickers: Tuple[str, ...]) -> Dict[str, Optional[float]]:
+    """
+    Last price for each ticker, with the fast_info lookups run side by side, so three
+    symbols cost about one round-trip. Missing prices come back as None (the caller
+    falls back to the robust fetcher).
+    """
+    symbols = list(dict.fromkeys(t for t in tickers if t))
+    if not symbols:
+        return {}
+
+    yf = _yf()
+    pool = _quote_pool()
+    futures = {tk: pool.submit(_fast_last_price, yf, tk) for tk in symbols}
+    return {tk: f.result() for tk, f in futures.items()}
+
+
+def get_intraday_series(tickers: Tuple[str, ...]) -> Tuple[Dict[str, pd.Series], List[Tuple[str, str]]]:
+    """
+    Intraday close series for the chart: one batched download first, then the
+    per-ticker fallbacks for anything the batch missed.
+    Returns ({ticker: series}, notes) where notes are (ticker, message) pairs.
+    """
+    batch = fetch_intraday_batch(tickers)
+    series_by_tk, notes = {}, []
+    for tk in tickers:
+        if not tk:
+            continue
+        if tk in batch:
+            series, msg = batch[tk], None
+        else:
+            _, series, msg = fetch_live_price_and_intraday(tk)
+        if series is not None and not series.empty:
+            series_by_tk[tk] = series
+        if msg:
+            notes.append((tk, msg))
+    return series_by_tk, notes
+
+
 # =========================
 # Reminders helpers
 # =========================
-def add_reminder(text: str, due: date):
-    """Store reminders with a timezone-aware UTC 'created' timestamp."""
-    reminders.append({
+def _insert_reminder(text: str, due_iso: str) -> str:
+    """Add one reminder to the store + sort index (no save). Returns its new id."""
+    id_ = uuid4().hex
+    reminders[id_] = {
+        "id": id_,
         "text": text.strip(),
-        "due": due.isoformat(),
+        "due": due_iso,
         "created": datetime.now(timezone.utc).isoformat()
-    })
-    save_json(REMINDERS_PATH, reminders)
+    }
+    _index_reminder(id_, due_iso)
+    return id_
+
+
+def _reminder_records() -> List[Dict]:
+    """Reminders in due order — the order they're saved in, so loading needs no sort."""
+    return [reminders[id_] for _, id_ in reminder_order]
+
+
+def _save_reminders():
+    """Persist in sort-index order (see _load_reminders)."""
+    save_json(REMINDERS_PATH, _reminder_records())
 
 
-def delete_reminder(index: int):
-    if 0 <= index < len(reminders):
-        reminders.pop(index)
-        save_json(REMINDERS_PATH, reminders)
+def _index_reminder(id_: str, due_iso: str):
+    """Add one (due, id) pair to the sort index (O(log n) search keeps the order)."""
+    bisect.insort(reminder_order, (due_iso, id_))
+
+
+def _unindex_reminder(id_: str, due_iso: str):
+    """Drop one (due, id) pair from the sort index."""
+    key = (due_iso, id_)
+    i = bisect.bisect_left(reminder_order, key)
+    if i < len(reminder_order) and reminder_order[i] == key:
+        del reminder_order[i]
+
+
+def add_reminder(text: str, due: date):
+    """Store reminders with a stable id and a timezone-aware UTC 'created' timestamp."""
+    _insert_reminder(text, due.isoformat())
+    _save_reminders()
+
+
+def apply_reminder_edits(rows: List[Dict]) -> bool:
+    """
+    Sync the store with rows coming back from st.data_editor in one pass:
+    rows gone from the table are deleted, changed text/due are updated, and rows
+    without an id are added. Blank text or due values leave a row unchanged
+    (or skip a new row). Saves once at the end; returns True if anything changed.
+    """
+    seen = set()
+    changed = False
+    for row in rows:
+        id_ = row.get("id")
+        text = str(row.get("text") or "").strip()
+        # The editor may hand back a date, a Timestamp or an ISO string (e.g. when the
+        # table started empty and the column had no date type yet) — accept all
+        due_ts = pd.to_datetime(row.get("due"), errors="coerce")
+        due_iso = None if pd.isna(due_ts) else due_ts.date().isoformat()
+
+        if isinstance(id_, str) and id_ in reminders:
+            seen.add(id_)
+            r = reminders[id_]
+            if text and text != r["text"]:
+                r["text"] = text
+                changed = True
+            if due_iso and due_iso != r.get("due"):
+                _unindex_reminder(id_, r.get("due", ""))
+                r["due"] = due_iso
+                _index_reminder(id_, due_iso)
+                changed = True
+        elif text and due_iso:
+            seen.add(_insert_reminder(text, due_iso))
+            changed = True
+
+    for id_ in [i for i in reminders if i not in seen]:
+        _unindex_reminder(id_, reminders.pop(id_).get("due", ""))
+        changed = True
+
+    if changed:
+        _save_reminders()
+    return changed
 
 
 def get_reminders_for_range(start: date, end: date) -> List[Dict]:
-    """Return reminders whose due date falls between start and end (inclusive)."""
+    """
+    Return reminders whose due date falls between start and end (inclusive), by due date.
+    ISO dates sort like real dates, so two binary searches on the sort index find
+    the slice; malformed due strings are skipped as before.
+    """
+    lo = bisect.bisect_left(reminder_order, (start.isoformat(),))
+    hi = bisect.bisect_left(reminder_order, ((end + timedelta(days=1)).isoformat(),))
     out = []
-    for r in reminders:
+    for due, id_ in reminder_order[lo:hi]:
         try:
-            due = date.fromisoformat(r["due"])
-            if start <= due <= end:
-                out.append(r)
-        except Exception:
+            date.fromisoformat(due)
+        except ValueError:
             continue
-    return sorted(out, key=lambda x: x["due"])
+        out.append(reminders[id_])
+    return out
 
 
 # =========================
@@ -372,14 +727,24 @@ _inject_theme_css(settings.get("dark_mode", False))
 
 st.title("🧭 Personal Dashboard")
 st.caption("Auto-refreshes every 60 seconds so your time, weather, and stocks feel fresh.")
-st_autorefresh(interval=60 * 1000, key="refresh60s")
 
-tab1, tab2, tab3, tab4 = st.tabs(["⏰ Weather & Time", "📈 Stocks", "🗒️ Reminders", "🔗 Favorites"])
+# A selector instead of st.tabs: st.tabs runs every tab's body on each run, so the
+# 60s live fragments would keep fetching even while hidden. Here only the chosen
+# tab is rendered; switching tabs is a full rerun that drops the others' timers.
+TAB_NAMES = ["⏰ Weather & Time", "📈 Stocks", "🗒️ Reminders", "🔗 Favorites"]
+active_tab = st.radio("Section", TAB_NAMES, horizontal=True, label_visibility="collapsed", key="active_tab")
 
 # ---------- TAB 1: Weather & Time ----------
-with tab1:
+@st.fragment(run_every="60s")
+def render_weather_tab():
+    """Live tab: while selected, reruns on its own every 60s without re-running the rest of the page."""
     st.subheader("⏰ Date & Time")
-    tzinfo = tz.gettz(settings.get("timezone", "America/Los_Angeles"))
+    tz_name = settings.get("timezone", "America/Los_Angeles")
+    try:
+        tzinfo = ZoneInfo(tz_name)  # ZoneInfo caches instances per key internally
+    except Exception:
+        st.warning(f"Unknown timezone '{tz_name}'. Showing server local time.")
+        tzinfo = None
     now_local = datetime.now(tzinfo)
     c1, c2, c3 = st.columns(3)
     c1.metric("Date", now_local.strftime("%A, %b %d, %Y"))
@@ -408,25 +773,28 @@ with tab1:
             cleaned = sanitize_city_input(city)
             st.info(f"Testing geocoding for: **{cleaned}**")
 
-            # Query both geocoders directly and display raw output for learning/debug
-            try:
-                r1 = requests.get(
+            # Query both geocoders directly and display raw output for learning/debug.
+            # Both calls are pure I/O, so run them side by side instead of back-to-back.
+            def _get_json(url, **kwargs):
+                try:
+                    return SESSION.get(url, **kwargs).json()
+                except Exception as e:
+                    return {"error": str(e)}  # Soft-fail: show the error in the raw view
+
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                f1 = ex.submit(
+                    _get_json,
                     "https://geocoding-api.open-meteo.com/v1/search",
                     params={"name": cleaned, "count": 3, "language": "en"},
                     timeout=10,
-                ).json()
-            except Exception as e:
-                r1 = {"error": str(e)}
-
-            try:
-                r2 = requests.get(
+                )
+                f2 = ex.submit(
+                    _get_json,
                     "https://nominatim.openstreetmap.org/search",
                     params={"q": cleaned, "format": "json", "limit": 3, "addressdetails": 1},
-                    headers={"User-Agent": "PythonDashboard/1.0"},
                     timeout=12,
-                ).json()
-            except Exception as e:
-                r2 = {"error": str(e)}
+                )
+                r1, r2 = f1.result(), f2.result()
 
             with st.expander("🔍 Raw Open-Meteo results"):
                 st.json(r1)
@@ -436,16 +804,30 @@ with tab1:
     # Resolve city -> coordinates; optional manual override
     manual_coords = st.checkbox("Advanced: enter coordinates manually")
     lat, lon = None, None
+    geo_error = None
 
     if manual_coords:
         cA, cB = st.columns(2)
         lat = cA.number_input("Latitude", value=37.7749, format="%.6f")
         lon = cB.number_input("Longitude", value=-122.4194, format="%.6f")
         coords = (lat, lon)
+    elif (settings["city"] != st.session_state.get("last_geo_city")
+          or not st.session_state.get("last_geo_coords")):
+        # Only geocode when the saved city changed (or has no coords yet); other
+        # widget reruns reuse it. Failed lookups aren't stored, so they get retried.
+        try:
+            coords = geocode_city(settings["city"])
+        except Exception as e:
+            coords, geo_error = None, e
+        if coords:
+            st.session_state["last_geo_coords"] = coords
+            st.session_state["last_geo_city"] = settings["city"]
     else:
-        coords = geocode_city(settings["city"])
+        coords = st.session_state.get("last_geo_coords")
 
-    if not coords:
+    if geo_error is not None:
+        st.error(f"Couldn't reach the geocoding services ({geo_error}). Will retry on the next refresh.")
+    elif not coords:
         st.error("City not found. Try 'San Francisco, CA' or 'San Francisco, United States'.")
         with st.expander("Why might this fail?"):
             st.write(
@@ -470,8 +852,10 @@ with tab1:
                     cur_temp = current.get("temperature_2m")
                     cur_wind = current.get("wind_speed_10m")
                     wcode = current.get("weather_code")
-                    desc = WEATHER_CODE_MAP.get(wcode, "Conditions")
-                    icon = WEATHER_ICON_MAP.get(wcode, "🌡️")
+                    desc, icon = "Conditions", "🌡️"
+                    if isinstance(wcode, int) and 0 <= wcode < len(WEATHER_DESC_ARR):
+                        desc = WEATHER_DESC_ARR[wcode] or desc
+                        icon = WEATHER_ICON_ARR[wcode] or icon
 
                     k1, k2, k3 = st.columns(3)
                     k1.metric("Temp", f"{cur_temp}°{settings['units']}" if cur_temp is not None else "—")
@@ -487,10 +871,14 @@ with tab1:
                 # 10-day forecast (if present)
                 if daily and "time" in daily:
                     times = daily.get("time", [])
-                    icon_list = [WEATHER_ICON_MAP.get(code, "") for code in daily.get("weather_code", [None] * len(times))]
+                    # Vectorized code -> emoji lookup (np.take) instead of a per-row list comp;
+                    # missing/out-of-range codes get a blank icon
+                    codes = pd.to_numeric(pd.Series(daily.get("weather_code", [None] * len(times))), errors="coerce")
+                    valid = codes.between(0, len(WEATHER_ICON_ARR) - 1)
+                    icons = np.where(valid, np.take(WEATHER_ICON_ARR, codes.where(valid, 0).astype(int)), "")
                     df = pd.DataFrame({
                         "date": pd.to_datetime(times),
-                        "icon": icon_list,
+                        "icon": icons,
                         "high": daily.get("temperature_2m_max", []),
                         "low": daily.get("temperature_2m_min", []),
                         "precip_prob(%)": daily.get("precipitation_probability_max", [None] * len(times))
@@ -508,61 +896,81 @@ with tab1:
             with st.expander("Show technical details"):
                 st.exception(e)
 
+
 # ---------- TAB 2: Stocks ----------
-with tab2:
+@st.fragment(run_every="60s")
+def render_stocks_tab():
+    """Live tab: while selected, refreshes prices every 60s independently of the rest of the page."""
     st.subheader("📈 Stocks")
 
-    tickers = settings.get("tickers", ["AAPL", "MSFT", "NVDA"])
-    a, b, c = st.columns(3)
-    tickers[0] = a.text_input("Ticker 1", tickers[0]).strip().upper()
-    tickers[1] = b.text_input("Ticker 2", tickers[1]).strip().upper()
-    tickers[2] = c.text_input("Ticker 3", tickers[2]).strip().upper()
+    # One comma-separated input (one widget, one rerun per edit; easy to paste a list)
+    saved = settings.get("tickers", ["AAPL", "MSFT", "NVDA"])
+    raw = st.text_input("Tickers (comma-separated, up to 3)", ", ".join(t for t in saved if t))
+    tickers = [t.strip().upper() for t in raw.split(",") if t.strip()][:3]
 
     if st.button("Save Tickers"):
         settings["tickers"] = tickers
         save_json(SETTINGS_PATH, settings)
         st.success("Tickers saved.")
 
-    metric_cols = st.columns(3)
-    series_list = []
+    if not tickers:
+        st.info("Enter at least one ticker symbol, e.g. AAPL, MSFT, NVDA.")
+        return
+
+    # Intraday bars are only downloaded when the chart is switched on.
+    # (A toggle, not an expander: expander contents run even while collapsed.)
+    show_chart = st.toggle("Show intraday chart (adds pre/post-market prices)", key="show_intraday_chart")
+
     notes = []
+    series_by_tk = {}
+    if show_chart:
+        series_by_tk, notes = get_intraday_series(tuple(tickers))
+
+    # With the chart on, each metric is the last point of its (pre/post) series, so
+    # the two always agree. Otherwise, or for tickers the chart missed, use the
+    # concurrent fast_info lookups; the heavy robust fetcher is the last resort.
+    prices = {tk: float(series.iloc[-1]) for tk, series in series_by_tk.items()}
+    missing = tuple(tk for tk in tickers if tk not in prices)
+    if missing:
+        prices.update(get_last_prices(missing))
 
+    metric_cols = st.columns(3)
     for i, tk in enumerate(tickers):
-        if not tk:
-            metric_cols[i].metric("—", "N/A")
-            notes.append(("—", "No ticker provided."))
-            continue
-
-        price, close_series, msg = fetch_live_price_and_intraday(tk)
+        price = prices.get(tk)
+        if price is None:
+            price, _, msg = fetch_live_price_and_intraday(tk)
+            if msg and (tk, msg) not in notes:
+                notes.append((tk, msg))
         metric_cols[i].metric(tk, f"${price:,.2f}" if price is not None else "N/A")
-        if close_series is not None and not close_series.empty:
-            series_list.append(close_series)
 
-        if msg:
-            notes.append((tk, msg))
-
-    if series_list:
-        merged = pd.concat(series_list, axis=1).dropna(how="all")
-        if not merged.empty:
-            st.write("**Intraday Close (auto-interval with pre/post)**")
-            st.line_chart(merged)
+    if show_chart:
+        if series_by_tk:
+            merged = pd.concat(list(series_by_tk.values()), axis=1).dropna(how="all")
+            if not merged.empty:
+                st.write("**Intraday Close (auto-interval with pre/post)**")
+                st.line_chart(merged)
+            else:
+                st.caption("Fetched data but no overlapping timestamps to plot.")
         else:
-            st.caption("Fetched data but no overlapping timestamps to plot.")
+            st.caption("No intraday series available to plot yet.")
     else:
-        st.caption("No intraday series available to plot yet.")
+        st.caption("Prices are regular-session last trades. Turn on the chart to include pre/post-market.")
 
     if notes:
         with st.expander("Data fetch notes"):
             for tk, m in notes:
                 st.write(f"- **{tk}**: {m}")
 
+
 # ---------- TAB 3: Reminders ----------
-with tab3:
+@st.fragment
+def render_reminders_tab():
+    """Static tab: only reruns on user action (no timer)."""
     st.subheader("🗒️ Reminders")
 
     # Export everything as CSV (handy for Excel/Sheets)
     if reminders:
-        df_all = pd.DataFrame(reminders)[["text", "due", "created"]]
+        df_all = pd.DataFrame(_reminder_records())[["text", "due", "created"]]
         csv = df_all.to_csv(index=False).encode("utf-8")
         st.download_button("⬇️ Export Reminders", data=csv, file_name="reminders.csv", mime="text/csv")
     else:
@@ -604,16 +1012,41 @@ with tab3:
                 st.warning("Please enter some reminder text.")
 
     st.write("### Manage All Reminders")
-    if reminders:
-        for i, r in enumerate(sorted(reminders, key=lambda x: x["due"])):
-            cols = st.columns([7, 2])
-            cols[0].write(f"- **{r['text']}** (due {r['due']})")
-            if cols[1].button("Delete", key=f"del_{i}"):
-                delete_reminder(i)
-                st.rerun()
+    # One table widget instead of a row of columns + buttons per reminder.
+    # Edit cells, add rows at the bottom, or select rows and delete them, then Save.
+    df_rem = pd.DataFrame(
+        _reminder_records(),
+        columns=["id", "text", "due", "created"],
+    )
+    df_rem["due"] = pd.to_datetime(df_rem["due"], errors="coerce").dt.date
+    # Bumping the key after a save resets the editor to the freshly stored rows
+    rev = st.session_state.setdefault("reminders_editor_rev", 0)
+    edited = st.data_editor(
+        df_rem,
+        num_rows="dynamic",
+        hide_index=True,
+        column_order=["text", "due", "created"],
+        column_config={
+            "text": st.column_config.TextColumn("Reminder", required=True),
+            "due": st.column_config.DateColumn("Due", required=True),
+            "created": st.column_config.TextColumn("Created (UTC)"),
+        },
+        disabled=["id", "created"],
+        width="stretch",
+        key=f"reminders_editor_{rev}",
+    )
+    if st.button("Save changes", key="save_reminder_edits"):
+        if apply_reminder_edits(edited.to_dict("records")):
+            st.session_state["reminders_editor_rev"] = rev + 1
+            st.rerun()
+        else:
+            st.info("No changes to save.")
+
 
 # ---------- TAB 4: Favorites ----------
-with tab4:
+@st.fragment
+def render_favorites_tab():
+    """Static tab: only reruns on user action (no timer)."""
     st.subheader("🔗 Favorites")
 
     if favorites:
@@ -641,6 +1074,18 @@ with tab4:
             else:
                 st.warning("Please provide both a name and a URL.")
 
+
+
+# Render just the selected section
+if active_tab == TAB_NAMES[0]:
+    render_weather_tab()
+elif active_tab == TAB_NAMES[1]:
+    render_stocks_tab()
+elif active_tab == TAB_NAMES[2]:
+    render_reminders_tab()
+else:
+    render_favorites_tab()
+
 st.write("---")
 st.caption("Built with ❤️ in Streamlit — Pacific time by default. Tweak settings anytime; the app hot-reloads.")
 